@@ -0,0 +1,159 @@
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from graph_utils import load_dimacs_graph
+from ga import GeneticAlgorithm
+from heuristics import dsatur
+
+
+def run_job(
+    file_name,
+    seed,
+    ga_params=None,
+    sa_params=None,
+    gif_path=None,
+    headless=False,
+    fixed_k=False,
+    checkpoint=None,
+):
+    # Run GA + SA once on one instance with a fixed seed. With a checkpoint
+    # path the GA saves its state there periodically and resumes from it if
+    # the file already exists (e.g. after the job was preempted). With a
+    # gif_path the GA's frames are streamed straight into that animation.
+    num_nodes, edges = load_dimacs_graph(file_name)
+
+    start = time.perf_counter()
+    ga = GeneticAlgorithm(
+        num_nodes=num_nodes,
+        edges=edges,
+        log_fn=None,
+        seed=seed,
+        save_frames=gif_path is not None,
+        gif_path=gif_path,
+        headless=headless,
+        checkpoint_path=checkpoint,
+        **(ga_params or {}),
+    )
+    if fixed_k:
+        resume = checkpoint if checkpoint and os.path.exists(checkpoint) else None
+        coloring = ga.solve_decreasing_k(resume_from=resume)
+    elif checkpoint is not None and os.path.exists(checkpoint):
+        coloring = ga.run(resume_from=checkpoint)
+    else:
+        coloring = ga.run()
+    if coloring is None:
+        # No generation ran (e.g. stopped at once): refine DSATUR's coloring
+        coloring = dsatur(ga.adj_offsets, ga.adj_neighbors, num_nodes)
+    ga_time = time.perf_counter() - start
+    coloring = ga.simulated_annealing(coloring, **(sa_params or {}))
+    total_time = time.perf_counter() - start
+
+    return {
+        "file": file_name,
+        "seed": seed,
+        "colors": len(set(coloring)),
+        "conflicts": ga.count_conflicts(coloring),
+        "ga_time": ga_time,
+        "time": total_time,
+        "coloring": list(coloring),
+        "gif_path": gif_path,
+    }
+
+
+def run_batch(
+    files,
+    seeds,
+    ga_params=None,
+    sa_params=None,
+    max_workers=None,
+    frame_root=None,
+    headless=False,
+    fixed_k=False,
+    checkpoint_dir=None,
+    log_fn=print,
+):
+    # Fan out (instance x seed) jobs across a process pool.
+    # With frame_root set, each job writes its animation to
+    # <frame_root>/<instance>_seed<n>.gif (no per-frame files).
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for file_name in files:
+            for seed in seeds:
+                gif_path = None
+                if frame_root is not None:
+                    os.makedirs(frame_root, exist_ok=True)
+                    gif_path = os.path.join(
+                        frame_root, f"{os.path.basename(file_name)}_seed{seed}.gif"
+                    )
+                checkpoint = None
+                if checkpoint_dir is not None:
+                    os.makedirs(checkpoint_dir, exist_ok=True)
+                    checkpoint = os.path.join(
+                        checkpoint_dir, f"{os.path.basename(file_name)}_seed{seed}.ckpt"
+                    )
+                futures.append(
+                    executor.submit(
+                        run_job,
+                        file_name,
+                        seed,
+                        ga_params,
+                        sa_params,
+                        gif_path=gif_path,
+                        headless=headless,
+                        fixed_k=fixed_k,
+                        checkpoint=checkpoint,
+                    )
+                )
+
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            log_fn(
+                f"{result['file']} seed {result['seed']}: "
+                f"{result['colors']} colors, {result['conflicts']} conflicts, "
+                f"{result['time']:.1f}s"
+            )
+
+    results.sort(key=lambda r: (r["file"], r["seed"]))
+    return results
+
+
+def summarize(results):
+    # Aggregate per-instance best/mean/std of color counts and run times. The
+    # best run is the one with the fewest conflicts, then the fewest colors
+    by_file = {}
+    for result in results:
+        by_file.setdefault(result["file"], []).append(result)
+
+    summary = {}
+    for file_name, runs in by_file.items():
+        colors = [r["colors"] for r in runs]
+        times = [r["time"] for r in runs]
+        best_run = min(runs, key=lambda r: (r["conflicts"], r["colors"]))
+        summary[file_name] = {
+            "runs": len(runs),
+            "best": best_run["colors"],
+            "conflicts": best_run["conflicts"],
+            "mean": statistics.mean(colors),
+            "std": statistics.stdev(colors) if len(colors) > 1 else 0.0,
+            "mean_time": statistics.mean(times),
+            "best_run": best_run,
+        }
+    return summary
+
+
+def format_table(summary):
+    # Render the per-instance summary as a plain-text table
+    lines = [
+        f"{'instance':<20}{'runs':>6}{'best':>6}{'conflicts':>11}{'mean':>8}"
+        f"{'std':>8}{'time(s)':>10}"
+    ]
+    for file_name, row in summary.items():
+        lines.append(
+            f"{os.path.basename(file_name):<20}{row['runs']:>6}{row['best']:>6}"
+            f"{row['conflicts']:>11}{row['mean']:>8.2f}{row['std']:>8.2f}{row['mean_time']:>10.1f}"
+        )
+    return "\n".join(lines)
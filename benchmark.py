@@ -0,0 +1,170 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from graph_utils import load_dimacs_graph
+from ga import GeneticAlgorithm
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Bundled DIMACS instances used by default
+instances = [
+    "./data/gc_50_9",
+    "./data/gc_70_9",
+    "./data/gc_100_9",
+    "./data/gc_250_9",
+    "./data/gc_500_9",
+]
+
+
+def peak_memory_mb():
+    # Peak resident set size of the current process (ru_maxrss is in bytes on
+    # macOS and in KiB elsewhere)
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if platform.system() == "Darwin" else 1024)
+
+
+def benchmark_job(file_name, seed, ga_params, sa_params):
+    # Measure one headless GA + SA run on one instance
+    num_nodes, edges = load_dimacs_graph(file_name)
+    ga = GeneticAlgorithm(
+        num_nodes=num_nodes,
+        edges=edges,
+        log_fn=None,
+        seed=seed,
+        headless=True,
+        **ga_params,
+    )
+
+    start = time.perf_counter()
+    coloring = ga.run()
+    ga_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    coloring = ga.simulated_annealing(coloring, **sa_params)
+    sa_time = time.perf_counter() - start
+
+    return {
+        "instance": os.path.basename(file_name),
+        "seed": seed,
+        "nodes": num_nodes,
+        "edges": len(edges),
+        "generations": ga.generations_run,
+        "ga_time": ga_time,
+        "sa_time": sa_time,
+        "generations_per_sec": ga.generations_run / ga_time,
+        "evaluations_per_sec": ga.evaluations / ga_time,
+        "first_feasible_gen": ga.first_feasible_gen,
+        "first_feasible_time": ga.first_feasible_time,
+        "final_colors": len(set(coloring)),
+        "final_conflicts": ga.count_conflicts(coloring),
+        "peak_memory_mb": peak_memory_mb(),
+    }
+
+
+def run_benchmark(files, seeds, ga_params, sa_params, log_fn=print):
+    # Run each job alone in a fresh worker process so timings do not compete
+    # for cores and peak memory is measured per job. Workers are spawned, not
+    # forked: a forked child's ru_maxrss starts at the parent's peak
+    spawn = multiprocessing.get_context("spawn")
+    results = []
+    for file_name in files:
+        for seed in seeds:
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+                result = executor.submit(
+                    benchmark_job, file_name, seed, ga_params, sa_params
+                ).result()
+            results.append(result)
+            log_fn(
+                f"{result['instance']} seed {seed}: "
+                f"{result['generations_per_sec']:.1f} gen/s, "
+                f"{result['evaluations_per_sec']:.0f} evals/s, "
+                f"{result['final_colors']} colors, "
+                f"peak {result['peak_memory_mb'] or 0:.0f} MB"
+            )
+    return results
+
+
+def git_revision():
+    # Current commit, so reports can be matched to code versions
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline):
+    # Print relative throughput changes against a previous report
+    previous = {(r["instance"], r["seed"]): r for r in baseline["results"]}
+    for result in report["results"]:
+        old = previous.get((result["instance"], result["seed"]))
+        if old is None:
+            continue
+        change = result["generations_per_sec"] / old["generations_per_sec"] - 1
+        print(
+            f"{result['instance']} seed {result['seed']}: "
+            f"gen/s {change:+.1%}, colors {old['final_colors']} -> "
+            f"{result['final_colors']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GA + SA on DIMACS graphs")
+    parser.add_argument("files", nargs="*", default=instances)
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--pop-size", type=int, default=100)
+    parser.add_argument("--max-gen", type=int, default=200)
+    parser.add_argument("--engine", default="Python", choices=["Python", "NumPy"])
+    parser.add_argument("--kernels", default="Python", choices=["Python", "Numba"])
+    parser.add_argument(
+        "--reproduction", default="Sequential", choices=["Sequential", "Batched"]
+    )
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--baseline", help="previous report to compare against")
+    args = parser.parse_args()
+
+    ga_params = {
+        "pop_size": args.pop_size,
+        "max_gen": args.max_gen,
+        "engine": args.engine,
+        "kernels": args.kernels,
+        "reproduction": args.reproduction,
+    }
+    sa_params = {"initial_temp": 500.0, "cooling_rate": 0.90, "max_iter": 2000}
+
+    results = run_benchmark(args.files, args.seeds, ga_params, sa_params)
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "ga_params": ga_params,
+        "sa_params": sa_params,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Benchmark report saved as {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import base64
+import json
+import os
+import zlib
+from array import array
+
+# Bumped whenever the checkpoint layout changes
+CHECKPOINT_VERSION = 4
+
+
+def pack_population(population):
+    # Flatten a list of colorings into one compact unsigned integer array
+    genomes = [list(ind) for ind in population]
+    largest = max((max(g) for g in genomes if g), default=0)
+    typecode = "H" if largest < 2**16 else "I"
+    flat = array(typecode)
+    for genome in genomes:
+        flat.extend(genome)
+    return {
+        "typecode": typecode,
+        "genome_length": len(genomes[0]) if genomes else 0,
+        "data": base64.b64encode(flat.tobytes()).decode("ascii"),
+    }
+
+
+def unpack_population(packed):
+    flat = array(packed["typecode"])
+    flat.frombytes(base64.b64decode(packed["data"]))
+    length = packed["genome_length"]
+    if length == 0:
+        return []
+    return [flat[i : i + length].tolist() for i in range(0, len(flat), length)]
+
+
+def _plain(value):
+    # JSON fallback for array rows and NumPy scalars
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Cannot store {type(value).__name__} in a checkpoint")
+
+
+def save_checkpoint(path, state):
+    # Write a compressed checkpoint atomically (temp file + rename), so an
+    # interrupted write never leaves a truncated checkpoint behind. The state
+    # is stored as JSON (never pickle), so loading a checkpoint from a shared
+    # directory cannot run code.
+    state = dict(state, version=CHECKPOINT_VERSION)
+    state["population"] = pack_population(state["population"])
+    payload = zlib.compress(json.dumps(state, default=_plain).encode("utf-8"))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    with open(path, "rb") as f:
+        payload = f.read()
+    try:
+        state = json.loads(zlib.decompress(payload))
+    except (zlib.error, ValueError):
+        state = None
+    if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}")
+    state["population"] = unpack_population(state["population"])
+    return state
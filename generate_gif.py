@@ -1,26 +1,97 @@
-from PIL import Image
+from PIL import Image, GifImagePlugin
 import os
 
-def generate_gif(frame_folder="frames", output_name="animation.gif", duration=200):
+
+class GifStreamWriter:
+    # Writes an animated GIF one frame at a time, so memory use does not
+    # grow with the number of frames. The palette of the first frame is
+    # reused for the rest unless reuse_palette is False, in which case each
+    # frame gets its own local color table.
+    def __init__(self, output_name, duration=200, loop=0, reuse_palette=True):
+        self.output_name = output_name
+        self.duration = duration
+        self.loop = loop
+        self.reuse_palette = reuse_palette
+        self.palette = None
+        self.frame_count = 0
+        self.fp = open(output_name, "wb")
+
+    def add(self, image):
+        # Quantize and append a single frame (a PIL image or an RGB array)
+        if not isinstance(image, Image.Image):
+            image = Image.fromarray(image)
+        frame = image.convert("RGB")
+        params = {"duration": self.duration}
+        if self.palette is None:
+            quantized = frame.quantize(256)
+            header, _ = GifImagePlugin.getheader(
+                quantized, info={"loop": self.loop, "duration": self.duration}
+            )
+            for block in header:
+                self.fp.write(block)
+            self.palette = quantized
+        elif self.reuse_palette:
+            quantized = frame.quantize(palette=self.palette, dither=Image.Dither.NONE)
+        else:
+            quantized = frame.quantize(256)
+            params["include_color_table"] = True
+
+        for block in GifImagePlugin.getdata(quantized, **params):
+            self.fp.write(block)
+        self.frame_count += 1
+
+    def close(self):
+        # Write the GIF trailer and close the file
+        if self.fp.closed:
+            return
+        self.fp.write(b";")
+        self.fp.close()
+        if self.frame_count == 0:
+            os.remove(self.output_name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_gif(frames, output_name, duration=200, step=1, reuse_palette=True):
+    # Stream an iterable of PIL images (e.g. in-memory frame buffers) into a
+    # looping GIF, keeping every step-th frame plus the last one
+    last = None
+    with GifStreamWriter(output_name, duration, reuse_palette=reuse_palette) as gif:
+        for idx, frame in enumerate(frames):
+            if idx % step == 0:
+                gif.add(frame)
+                last = None
+            else:
+                last = frame
+        if last is not None:
+            gif.add(last)
+        return gif.frame_count
+
+
+def generate_gif(
+    frame_folder="frames",
+    output_name="animation.gif",
+    duration=200,
+    step=1,
+    reuse_palette=True,
+):
     # Collect all PNG frames in order based on generation number
     frames = sorted(
         [f for f in os.listdir(frame_folder) if f.endswith(".png")],
         key=lambda x: int(x.split("_")[1].split(".")[0])
     )
 
-    # Load all frame images into memory
-    images = [Image.open(os.path.join(frame_folder, f)) for f in frames]
-
-    if images:
-        # Save the first frame and append the rest to create a looping GIF
-        images[0].save(
-            output_name,
-            format='GIF',
-            append_images=images[1:],
-            save_all=True,
-            duration=duration,
-            loop=0
-        )
+    def load_frames():
+        # Open frames lazily, one at a time
+        for f in frames:
+            with Image.open(os.path.join(frame_folder, f)) as im:
+                yield im.convert("RGB")
+
+    if frames and write_gif(load_frames(), output_name, duration, step, reuse_palette):
         print(f"GIF saved as {output_name}")
     else:
         print("No frames found to create GIF.")
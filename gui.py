@@ -1,12 +1,16 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, PhotoImage
 from PIL import ImageTk, Image, ImageSequence
-import glob
+import atexit
 import os
+import queue
+import shutil
+import tempfile
+import threading
 
 from graph_utils import load_dimacs_graph
 from ga import GeneticAlgorithm
-from visualization import save_coloring_image
+from visualization import save_coloring_image, graph_layout
 from generate_gif import generate_gif
 
 
@@ -16,9 +20,22 @@ class GraphColoringApp:
 
         # Initialize paths and state
         self.graph_file = None
+        self.graph_data = None
         self.result_image = None
         self.animation_job = None
 
+        # Frames of the current run live in their own temporary folder, so
+        # frames from earlier runs never end up in a new GIF
+        self.frame_folder = None
+        self.retired_frame_folders = []
+        atexit.register(self.clear_frames, force=True)
+
+        # Background worker state: GA/SA run off the Tk thread and report
+        # back through a queue polled with root.after
+        self.worker = None
+        self.worker_ga = None
+        self.worker_queue = queue.Queue()
+
         # Create left panel for controls and display
         top_panel = tk.Frame(root, bg="#f0f0f0")
         top_panel.pack(side="left", fill="both", expand=True, padx=10)
@@ -44,6 +61,7 @@ class GraphColoringApp:
         self.selection_method_var = tk.StringVar(value="Tournament")
         self.crossover_type_var = tk.StringVar(value="Single Point")
         self.mutation_mode_var = tk.StringVar(value="Adaptive")
+        self.seeding_var = tk.StringVar(value="Random")
 
         # Create parameter input widgets
         tk.Label(param_frame, text="Mutation Rate:", bg="#f0f0f0").grid(
@@ -88,6 +106,13 @@ class GraphColoringApp:
             row=1, column=5
         )
 
+        tk.Label(param_frame, text="Seeding:", bg="#f0f0f0").grid(
+            row=2, column=0, sticky="e"
+        )
+        tk.OptionMenu(param_frame, self.seeding_var, "Random", "Heuristic").grid(
+            row=2, column=1
+        )
+
         # Area for displaying output images
         self.image_label = tk.Label(top_panel, bg="#f0f0f0")
         self.image_label.pack(pady=(10, 10))
@@ -162,6 +187,16 @@ class GraphColoringApp:
         )
         self.show_gif_btn.pack(pady=2)
 
+        self.cancel_btn = tk.Button(
+            top_panel,
+            text="Cancel Run",
+            font=("Arial", 11),
+            width=25,
+            command=self.cancel_run,
+            state=tk.DISABLED,
+        )
+        self.cancel_btn.pack(pady=2)
+
         self.reset_btn = tk.Button(
             top_panel,
             text="Reset",
@@ -202,15 +237,12 @@ class GraphColoringApp:
         # Open file dialog to select a graph file
         file_path = filedialog.askopenfilename(filetypes=[("Graph Files", "gc_*")])
         if file_path:
-            # Clear frames directory before starting new run
-            if os.path.exists("frames"):
-                for f in glob.glob("frames/*.png"):
-                    os.remove(f)
-            else:
-                os.makedirs("frames")
+            # Drop the previous graph's frames
+            self.clear_frames()
 
             # Update UI with selected file
             self.graph_file = file_path
+            self.graph_data = None
             self.file_label.config(text=f"Selected: {os.path.basename(file_path)}")
             self.run_btn.config(state=tk.NORMAL)
             self.generate_gif_btn.config(state=tk.DISABLED)
@@ -230,15 +262,21 @@ class GraphColoringApp:
         if not self.graph_file:
             messagebox.showwarning("No File", "Please select a graph file first.")
             return
+        if self.worker is not None:
+            return
 
         # Clear the status box
         self.status_box.config(state=tk.NORMAL)
         self.status_box.delete("1.0", tk.END)
         self.log_status("Running Genetic Algorithm... Please wait.\n")
 
+        # Fresh frame folder for this run
+        self.clear_frames()
+        self.frame_folder = tempfile.mkdtemp(prefix="frames_")
+
         try:
             # Load graph data
-            num_nodes, edges = load_dimacs_graph(self.graph_file)
+            num_nodes, edges = self.load_graph()
 
             # Initialize GA with user-defined parameters
             ga = GeneticAlgorithm(
@@ -251,39 +289,47 @@ class GraphColoringApp:
                 selection_type=self.selection_method_var.get(),
                 crossover_type=self.crossover_type_var.get(),
                 mutation_mode=self.mutation_mode_var.get(),
-                log_fn=self.log_status,
+                seeding=self.seeding_var.get(),
+                frame_folder=self.frame_folder,
+                log_fn=self.queue_log,
+                log_interval=0.25,
+                log_batch=True,
             )
-
-            # Run GA and save results
-            coloring = ga.run()
-            self.ga_coloring = coloring
-            self.last_solution = coloring
-            self.sim_annealing_btn.config(state=tk.NORMAL)
-            self.compare_btn.config(state=tk.DISABLED)
-            self.generate_gif_btn.config(state=tk.NORMAL)
-
-            # Save output image
-            output_img = f"output_{os.path.basename(self.graph_file)}.png"
-            save_coloring_image(num_nodes, edges, coloring, output_img)
-            self.result_image_path = output_img
-            self.gif_path = "animation.gif"
-            self.show_png_btn.config(state=tk.NORMAL)
-            self.show_gif_btn.config(state=tk.NORMAL)
-            self.display_png()
-
-            used_colors = len(set(coloring))
-            self.log_status(f"\nDone! Used colors: {used_colors}")
-            self.log_status(f"Output image saved as: {output_img}")
-            self.show_result_image(output_img)
-
         except Exception as e:
             self.log_status(f" Error: {e}")
             messagebox.showerror("Error", str(e))
+            return
+
+        # Run GA in the background; finish_ga picks up the result
+        self.start_worker(ga, ga.run, self.finish_ga)
+
+    def finish_ga(self, coloring):
+        # Runs on the Tk thread once the GA worker has returned
+        num_nodes, edges = self.load_graph()
+        self.ga_coloring = coloring
+        self.last_solution = coloring
+        self.sim_annealing_btn.config(state=tk.NORMAL)
+        self.compare_btn.config(state=tk.DISABLED)
+        self.generate_gif_btn.config(state=tk.NORMAL)
+
+        # Save output image
+        output_img = f"output_{os.path.basename(self.graph_file)}.png"
+        save_coloring_image(num_nodes, edges, coloring, output_img)
+        self.result_image_path = output_img
+        self.gif_path = "animation.gif"
+        self.show_png_btn.config(state=tk.NORMAL)
+        self.show_gif_btn.config(state=tk.NORMAL)
+        self.display_png()
+
+        used_colors = len(set(coloring))
+        self.log_status(f"\nDone! Used colors: {used_colors}")
+        self.log_status(f"Output image saved as: {output_img}")
+        self.show_result_image(output_img)
 
     def generate_gif_only(self):
         try:
             # Generate GIF from saved coloring frames
-            generate_gif("frames", "animation.gif", duration=300)
+            generate_gif(self.frame_folder, "animation.gif", duration=300)
             self.gif_path = "animation.gif"
             self.log_status("GIF generated from frames.")
         except Exception as e:
@@ -293,39 +339,147 @@ class GraphColoringApp:
         if not hasattr(self, "last_solution"):
             messagebox.showwarning("Warning", "Please run the Genetic Algorithm first.")
             return
+        if self.worker is not None:
+            return
 
         try:
-            # Load graph again
-            num_nodes, edges = load_dimacs_graph(self.graph_file)
+            # Reuse the loaded graph
+            num_nodes, edges = self.load_graph()
 
             # Run Simulated Annealing on last GA result
             ga_temp = GeneticAlgorithm(
                 num_nodes=num_nodes,
                 edges=edges,
                 mutation_mode=self.mutation_mode_var.get(),
-                log_fn=self.log_status,
+                log_fn=self.queue_log,
             )
-            improved = ga_temp.simulated_annealing(self.last_solution)
-            self.last_solution = improved
-            self.sa_coloring = improved
-            self.compare_btn.config(state=tk.NORMAL)
-
-            # Save improved result
-            save_coloring_image(
-                num_nodes, edges, improved, "simulated_annealing_result.png"
-            )
-            from visualization import save_coloring_frame
+        except Exception as e:
+            self.log_status(f" Simulated Annealing Error: {e}")
+            messagebox.showerror("Error", str(e))
+            return
 
-            save_coloring_frame(num_nodes, edges, improved, 9999, folder="frames")
+        solution = self.last_solution
+        self.start_worker(
+            ga_temp, lambda: ga_temp.simulated_annealing(solution), self.finish_sa
+        )
 
-            self.log_status(
-                "Simulated Annealing complete. Saved as simulated_annealing_result.png"
-            )
+    def finish_sa(self, improved):
+        # Runs on the Tk thread once the SA worker has returned
+        num_nodes, edges = self.load_graph()
+        self.last_solution = improved
+        self.sa_coloring = improved
+        self.compare_btn.config(state=tk.NORMAL)
+
+        # Save improved result
+        save_coloring_image(
+            num_nodes, edges, improved, "simulated_annealing_result.png"
+        )
+        from visualization import save_coloring_frame
+
+        save_coloring_frame(
+            num_nodes,
+            edges,
+            improved,
+            9999,
+            folder=self.frame_folder,
+            pos=graph_layout(num_nodes, edges),
+        )
+
+        self.log_status(
+            "Simulated Annealing complete. Saved as simulated_annealing_result.png"
+        )
+
+    def clear_frames(self, force=False):
+        # Retire the current run's frame folder. It is removed at once, or,
+        # while a worker may still be rendering into it, by poll_worker once
+        # the worker has finished.
+        if self.frame_folder is not None:
+            self.retired_frame_folders.append(self.frame_folder)
+            self.frame_folder = None
+        if self.worker is None or force:
+            self.remove_retired_frames()
+
+    def remove_retired_frames(self):
+        for folder in self.retired_frame_folders:
+            shutil.rmtree(folder, ignore_errors=True)
+        self.retired_frame_folders = []
+
+    def start_worker(self, ga, task, on_done):
+        # Run task() on a worker thread and poll its queue from the Tk loop
+        def work():
+            try:
+                self.worker_queue.put(("done", on_done, task()))
+            except Exception as e:
+                self.worker_queue.put(("error", None, e))
+
+        self.worker_ga = ga
+        self.worker = threading.Thread(target=work, daemon=True)
+        self.run_btn.config(state=tk.DISABLED)
+        self.sim_annealing_btn.config(state=tk.DISABLED)
+        self.browse_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.worker.start()
+        self.root.after(100, self.poll_worker)
+
+    def queue_log(self, msg):
+        # log_fn for worker threads: Tk widgets are only touched in poll_worker
+        self.worker_queue.put(("log", None, msg))
+
+    def poll_worker(self):
+        # Drain worker messages: batch log lines, then handle completion
+        lines = []
+        finished = None
+        while True:
+            try:
+                kind, on_done, payload = self.worker_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                lines.append(payload)
+            else:
+                finished = (kind, on_done, payload)
+        if lines:
+            self.log_status("\n".join(lines))
 
+        if finished is None:
+            self.root.after(100, self.poll_worker)
+            return
+
+        self.worker = None
+        self.worker_ga = None
+        self.remove_retired_frames()
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.browse_btn.config(state=tk.NORMAL)
+        self.run_btn.config(state=tk.NORMAL if self.graph_file else tk.DISABLED)
+        if getattr(self, "last_solution", None) is not None:
+            self.sim_annealing_btn.config(state=tk.NORMAL)
+
+        # Results of a run that outlived a reset are discarded
+        kind, on_done, payload = finished
+        if self.graph_file is None:
+            return
+        if kind == "error":
+            self.log_status(f" Error: {payload}")
+            messagebox.showerror("Error", str(payload))
+            return
+        try:
+            on_done(payload)
         except Exception as e:
-            self.log_status(f" Simulated Annealing Error: {e}")
+            self.log_status(f" Error: {e}")
             messagebox.showerror("Error", str(e))
 
+    def cancel_run(self):
+        # Ask the running GA/SA to stop at the next generation boundary
+        if self.worker_ga is not None:
+            self.worker_ga.stop()
+            self.log_status("Cancelling run...")
+
+    def load_graph(self):
+        # Load the selected graph once and reuse it for GA, SA and comparison
+        if self.graph_data is None:
+            self.graph_data = load_dimacs_graph(self.graph_file)
+        return self.graph_data
+
     def log_status(self, msg):
         # Append message to status box
         self.status_box.config(state=tk.NORMAL)
@@ -394,10 +548,6 @@ class GraphColoringApp:
             self.image_label.image = photo
 
             # Count and compare number of used colors
-            from graph_utils import load_dimacs_graph
-
-            num_nodes, _ = load_dimacs_graph(self.graph_file)
-
             used_ga_colors = (
                 len(set(self.ga_coloring)) if hasattr(self, "ga_coloring") else 0
             )
@@ -420,7 +570,10 @@ class GraphColoringApp:
 
     def reset_interface(self):
         # Reset all UI elements and states
+        self.cancel_run()
+        self.clear_frames()
         self.graph_file = None
+        self.graph_data = None
         self.result_image_path = None
         self.gif_path = None
         self.last_solution = None
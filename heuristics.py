@@ -0,0 +1,54 @@
+import heapq
+import random
+
+
+def greedy_coloring(order, offsets, neighbors, num_nodes):
+    # Give each node, in the given order, the smallest color unused by its neighbors
+    coloring = [-1] * num_nodes
+    for u in order:
+        taken = {coloring[v] for v in neighbors[offsets[u] : offsets[u + 1]]}
+        color = 0
+        while color in taken:
+            color += 1
+        coloring[u] = color
+    return coloring
+
+
+def largest_first(offsets, neighbors, num_nodes):
+    # Greedy coloring visiting nodes by decreasing degree
+    order = sorted(range(num_nodes), key=lambda u: offsets[u] - offsets[u + 1])
+    return greedy_coloring(order, offsets, neighbors, num_nodes)
+
+
+def random_order_greedy(offsets, neighbors, num_nodes, rng=random):
+    # Greedy coloring over a random node order
+    order = list(range(num_nodes))
+    rng.shuffle(order)
+    return greedy_coloring(order, offsets, neighbors, num_nodes)
+
+
+def dsatur(offsets, neighbors, num_nodes):
+    # DSATUR: repeatedly color the node with the most distinct neighbor colors
+    # (ties broken by degree), using a lazy max-heap of (saturation, degree)
+    coloring = [-1] * num_nodes
+    neighbor_colors = [set() for _ in range(num_nodes)]
+    degree = [offsets[u + 1] - offsets[u] for u in range(num_nodes)]
+    heap = [(0, -degree[u], u) for u in range(num_nodes)]
+    heapq.heapify(heap)
+
+    while heap:
+        neg_sat, _, u = heapq.heappop(heap)
+        if coloring[u] != -1 or -neg_sat != len(neighbor_colors[u]):
+            continue  # Stale heap entry
+
+        color = 0
+        while color in neighbor_colors[u]:
+            color += 1
+        coloring[u] = color
+
+        for v in neighbors[offsets[u] : offsets[u + 1]]:
+            if coloring[v] == -1 and color not in neighbor_colors[v]:
+                neighbor_colors[v].add(color)
+                heapq.heappush(heap, (-len(neighbor_colors[v]), -degree[v], v))
+
+    return coloring
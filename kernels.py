@@ -0,0 +1,63 @@
+# Compiled versions of the per-gene GA operators, used when GeneticAlgorithm
+# is created with kernels="Numba". Each kernel repeats the reference loop in
+# ga.py step for step, so both backends give identical results for a seed.
+# Genomes are NumPy uint16/uint32 arrays and the adjacency is the CSR index.
+
+# Compiled kernels, built once per process by load_kernels()
+_compiled = None
+
+
+def color_aware_crossover(p1, p2, offsets, neighbors):
+    # Choose genes from the parent with fewer local conflicts
+    child = p1.copy()
+    for i in range(len(p1)):
+        c1 = p1[i]
+        c2 = p2[i]
+        conflicts_c1 = 0
+        conflicts_c2 = 0
+        for idx in range(offsets[i], offsets[i + 1]):
+            v = neighbors[idx]
+            if p1[v] == c1:
+                conflicts_c1 += 1
+            if p2[v] == c2:
+                conflicts_c2 += 1
+        child[i] = c1 if conflicts_c1 < conflicts_c2 else c2
+    return child
+
+
+def local_search(coloring, offsets, neighbors, palette):
+    # Bump the higher-numbered endpoint of each conflicting edge (in place)
+    for u in range(len(coloring)):
+        for idx in range(offsets[u], offsets[u + 1]):
+            v = neighbors[idx]
+            if v > u and coloring[u] == coloring[v]:
+                coloring[v] = (coloring[v] + 1) % palette
+    return coloring
+
+
+def count_conflicts(coloring, edge_u, edge_v):
+    # Number of edges whose endpoints share a color
+    conflicts = 0
+    for i in range(len(edge_u)):
+        if coloring[edge_u[i]] == coloring[edge_v[i]]:
+            conflicts += 1
+    return conflicts
+
+
+def load_kernels():
+    # Compile the kernels with Numba on first use; None if Numba is missing
+    global _compiled
+    if _compiled is None:
+        try:
+            from numba import njit
+        except ImportError:
+            return None
+
+        from types import SimpleNamespace
+
+        _compiled = SimpleNamespace(
+            color_aware_crossover=njit(cache=True)(color_aware_crossover),
+            local_search=njit(cache=True)(local_search),
+            count_conflicts=njit(cache=True)(count_conflicts),
+        )
+    return _compiled
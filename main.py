@@ -1,12 +1,8 @@
+import argparse
 import os
-import random
+import shutil
 from graph_utils import load_dimacs_graph
-from ga import GeneticAlgorithm
-from visualization import save_coloring_image
-from generate_gif import generate_gif
-
-# Optional: Seed for reproducibility
-# random.seed(42)
+from batch import run_batch, summarize, format_table
 
 # List of graph files to process
 # Files must be in DIMACS format without extensions (e.g., gc_500_9)
@@ -18,61 +14,115 @@ target_files = [
     "./data/gc_500_9",
 ]
 
-best_results = {}
-
-for file_name in target_files:
-    if not os.path.exists(file_name):
-        print(f"File not found: {file_name}")
-        continue
-
-    print(f"\nProcessing: {file_name}")
-    num_nodes, edges = load_dimacs_graph(file_name)
-
-    best_coloring = None
-    best_color_count = float("inf")
-
-    for run in range(1):  # Repeat if you want multiple runs to increase robustness
-        print(f"\nRun {run + 1}")
-        ga = GeneticAlgorithm(
-            num_nodes=num_nodes,
-            edges=edges,
-            pop_size=300,
-            mutation_rate=0.03,
-            max_gen=1500,
-            tournament_k=9,
-            crossover_type="Color Aware",
-            mutation_mode="Adaptive",
-        )
-
-        # Run GA
-        coloring = ga.run()
-
-        # Apply Simulated Annealing to refine result
-        coloring = ga.simulated_annealing(
-            coloring, initial_temp=500.0, cooling_rate=0.90, max_iter=2000
-        )
-
-        color_count = len(set(coloring))
-        print(f"     Used colors after SA: {color_count}")
-
-        # Keep best result
-        if color_count < best_color_count:
-            best_color_count = color_count
-            best_coloring = coloring[:]
-
-    best_results[file_name] = best_color_count
-    print(f"\nBest result for {file_name}: {best_color_count} colors")
-
-    # Save image
-    output_image = f"best_pic_{os.path.basename(file_name)}.png"
-    save_coloring_image(num_nodes, edges, best_coloring, output_image)
-    print(f" Saved image: {output_image}")
-
-# Create GIF animation of process
-generate_gif("frames", "animation.gif", duration=300)
-print("GIF created: animation.gif")
-
-# Final results
-print("\nFINAL BEST RESULTS:")
-for file_name, color_count in best_results.items():
-    print(f"   {file_name}: {color_count} colors")
+# GA and SA settings shared by every run
+ga_params = {
+    "pop_size": 300,
+    "mutation_rate": 0.03,
+    "max_gen": 1500,
+    "tournament_k": 9,
+    "crossover_type": "Color Aware",
+    "mutation_mode": "Adaptive",
+    "gif_duration": 300,
+}
+sa_params = {"initial_temp": 500.0, "cooling_rate": 0.90, "max_iter": 2000}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Graph coloring with GA + SA")
+    parser.add_argument(
+        "files", nargs="*", default=target_files, help="DIMACS graph files"
+    )
+    parser.add_argument(
+        "--runs", type=int, default=1, help="number of seeds per instance"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes (default: all cores)",
+    )
+    parser.add_argument(
+        "--frames",
+        action="store_true",
+        help="stream each run's frames into a GIF and keep one per instance",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="skip all plotting (no images, frames or GIFs)",
+    )
+    parser.add_argument(
+        "--fixed-k",
+        action="store_true",
+        help="search with a bounded palette, lowering k after each success",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        help="checkpoint each GA run here and resume unfinished runs",
+    )
+    parser.add_argument(
+        "--kernels",
+        default="Python",
+        choices=["Python", "Numba"],
+        help="operator kernels (Numba falls back to Python if not installed)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    files = []
+    for file_name in args.files:
+        if not os.path.exists(file_name):
+            print(f"File not found: {file_name}")
+            continue
+        files.append(file_name)
+
+    # Run every (instance, seed) job in parallel
+    print(f"\nProcessing {len(files)} instance(s) x {args.runs} run(s)")
+    results = run_batch(
+        files,
+        seeds=range(args.runs),
+        ga_params=dict(ga_params, kernels=args.kernels),
+        sa_params=sa_params,
+        max_workers=args.workers,
+        frame_root="frames" if args.frames and not args.headless else None,
+        headless=args.headless,
+        fixed_k=args.fixed_k,
+        checkpoint_dir=args.checkpoint_dir,
+    )
+    summary = summarize(results)
+
+    # Plotting libraries are only imported when output is requested
+    if not args.headless:
+        save_outputs(summary)
+
+    # Final results
+    print("\nFINAL BEST RESULTS:")
+    print(format_table(summary))
+
+
+def save_outputs(summary):
+    # Save the best coloring image (and GIF, if frames were kept) per instance
+    from visualization import save_coloring_image
+
+    for file_name, row in summary.items():
+        best_run = row["best_run"]
+        name = os.path.basename(file_name)
+
+        # Save image of the best coloring
+        num_nodes, edges = load_dimacs_graph(file_name)
+        output_image = f"best_pic_{name}.png"
+        save_coloring_image(num_nodes, edges, best_run["coloring"], output_image)
+        print(f" Saved image: {output_image}")
+
+        # Keep the GIF animation of the best run
+        if best_run["gif_path"] and os.path.exists(best_run["gif_path"]):
+            output_gif = f"animation_{name}.gif"
+            shutil.copyfile(best_run["gif_path"], output_gif)
+            print(f"GIF created: {output_gif}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import time
+
+
+class ProgressReporter:
+    # Fans structured progress events (plain dicts) out to subscribers.
+    # Each subscriber has its own throttle: it receives at most one delivery
+    # every `every` events and every `min_interval` seconds. With batch=True
+    # the events skipped in between are delivered together as a list.
+    def __init__(self):
+        self.subscribers = []
+
+    def subscribe(self, callback, every=1, min_interval=0.0, batch=False):
+        self.subscribers.append(
+            {
+                "callback": callback,
+                "every": max(1, every),
+                "min_interval": min_interval,
+                "batch": batch,
+                "count": 0,
+                "last_time": float("-inf"),
+                "pending": [],
+            }
+        )
+        return callback
+
+    def unsubscribe(self, callback):
+        self.subscribers = [s for s in self.subscribers if s["callback"] != callback]
+
+    def publish(self, event, force=False):
+        # Deliver an event to every subscriber whose throttle allows it;
+        # force=True bypasses throttling (e.g. for the final event of a run)
+        now = time.perf_counter()
+        for sub in self.subscribers:
+            sub["count"] += 1
+            if sub["batch"]:
+                sub["pending"].append(event)
+            due = sub["count"] >= sub["every"] and (
+                now - sub["last_time"] >= sub["min_interval"]
+            )
+            if not (due or force):
+                continue
+            sub["count"] = 0
+            sub["last_time"] = now
+            if sub["batch"]:
+                pending, sub["pending"] = sub["pending"], []
+                sub["callback"](pending)
+            else:
+                sub["callback"](event)
+
+
+def format_progress(event):
+    # Classic one-line log message for a generation event
+    return (
+        f"Gen {event['generation']}: Best fitness = {event['best_fitness']}, "
+        f"used colors = {event['used_colors']}"
+    )
@@ -0,0 +1,78 @@
+import random
+
+
+def tabucol(
+    coloring,
+    k,
+    offsets,
+    neighbors,
+    max_iter=1000,
+    tenure_base=10,
+    tenure_factor=0.6,
+    rng=random,
+):
+    # Tabucol local search for a proper k-coloring (colors must be 0..k-1).
+    # gamma[u * k + c] counts neighbors of u colored c, so the conflict change
+    # of moving u to c is gamma[u * k + c] - gamma[u * k + coloring[u]] (O(1)).
+    # A reversed move stays tabu for tenure_base random + tenure_factor *
+    # conflicts iterations unless it beats the best coloring seen (aspiration).
+    # Returns the coloring with the fewest conflicts found.
+    num_nodes = len(coloring)
+    current = list(coloring)
+
+    gamma = [0] * (num_nodes * k)
+    for u in range(num_nodes):
+        for v in neighbors[offsets[u] : offsets[u + 1]]:
+            if v != u:
+                gamma[u * k + current[v]] += 1
+    conflicts = sum(gamma[u * k + current[u]] for u in range(num_nodes)) // 2
+
+    tabu = [0] * (num_nodes * k)
+    best = current[:]
+    best_conflicts = conflicts
+
+    for it in range(max_iter):
+        if conflicts == 0:
+            break
+
+        # Best non-tabu (or aspirating) move among conflicting nodes
+        best_delta = None
+        moves = []
+        for u in range(num_nodes):
+            base = u * k
+            own = gamma[base + current[u]]
+            if own == 0:
+                continue
+            for color in range(k):
+                if color == current[u]:
+                    continue
+                delta = gamma[base + color] - own
+                if tabu[base + color] > it and conflicts + delta >= best_conflicts:
+                    continue
+                if best_delta is None or delta < best_delta:
+                    best_delta = delta
+                    moves = [(u, color)]
+                elif delta == best_delta:
+                    moves.append((u, color))
+
+        if not moves:
+            continue
+
+        # Apply the move and update gamma for the node's neighbors
+        u, color = rng.choice(moves)
+        old = current[u]
+        current[u] = color
+        conflicts += best_delta
+        for v in neighbors[offsets[u] : offsets[u + 1]]:
+            if v != u:
+                gamma[v * k + old] -= 1
+                gamma[v * k + color] += 1
+        tabu[u * k + old] = (
+            it + rng.randrange(tenure_base) + int(tenure_factor * conflicts) + 1
+        )
+
+        if conflicts < best_conflicts:
+            best_conflicts = conflicts
+            best = current[:]
+
+    return best
@@ -0,0 +1,88 @@
+import os
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("numba")
+
+from graph_utils import load_dimacs_graph
+from ga import GeneticAlgorithm
+from kernels import load_kernels
+
+GRAPH = os.path.join(os.path.dirname(__file__), "data", "gc_50_9")
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return load_dimacs_graph(GRAPH)
+
+
+@pytest.fixture(scope="module")
+def ga(graph):
+    num_nodes, edges = graph
+    return GeneticAlgorithm(num_nodes, edges, headless=True, log_fn=None, seed=0)
+
+
+def random_colorings(num_nodes, count, palette, seed=0):
+    rng = random.Random(seed)
+    return [[rng.randrange(palette) for _ in range(num_nodes)] for _ in range(count)]
+
+
+def test_color_aware_crossover_matches_reference(ga):
+    kernels = load_kernels()
+    parents = random_colorings(ga.num_nodes, 20, 12)
+    for p1, p2 in zip(parents[::2], parents[1::2]):
+        compiled = kernels.color_aware_crossover(
+            ga.kernel_genome(p1),
+            ga.kernel_genome(p2),
+            np.array(ga.adj_offsets, dtype=np.intp),
+            np.array(ga.adj_neighbors, dtype=np.intp),
+        )
+        assert compiled.tolist() == ga.color_aware_crossover(p1, p2)
+
+
+def test_local_search_matches_reference(ga):
+    kernels = load_kernels()
+    for coloring in random_colorings(ga.num_nodes, 10, 8, seed=1):
+        compiled = kernels.local_search(
+            ga.kernel_genome(coloring),
+            np.array(ga.adj_offsets, dtype=np.intp),
+            np.array(ga.adj_neighbors, dtype=np.intp),
+            ga.palette_size,
+        )
+        assert compiled.tolist() == ga.local_search(list(coloring))
+
+
+def test_count_conflicts_matches_reference(ga):
+    kernels = load_kernels()
+    edges = np.array(ga.edges, dtype=np.intp)
+    for coloring in random_colorings(ga.num_nodes, 10, 15, seed=2):
+        compiled = kernels.count_conflicts(
+            ga.kernel_genome(coloring), edges[:, 0], edges[:, 1]
+        )
+        assert compiled == ga.count_conflicts(coloring)
+
+
+@pytest.mark.parametrize("engine", ["Python", "NumPy"])
+@pytest.mark.parametrize("selection_type", ["Tournament", "Roulette"])
+@pytest.mark.parametrize("crossover_type", ["Single Point", "Uniform", "Color Aware"])
+def test_runs_match_under_fixed_seed(graph, engine, selection_type, crossover_type):
+    num_nodes, edges = graph
+    runs = []
+    for kernels in ("Python", "Numba"):
+        ga = GeneticAlgorithm(
+            num_nodes,
+            edges,
+            pop_size=30,
+            max_gen=15,
+            engine=engine,
+            selection_type=selection_type,
+            crossover_type=crossover_type,
+            kernels=kernels,
+            headless=True,
+            log_fn=None,
+            seed=7,
+        )
+        runs.append((ga.run(), ga.evaluations))
+    assert runs[0] == runs[1]
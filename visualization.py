@@ -1,3 +1,64 @@
+import hashlib
+import os
+from array import array
+
+# Where spring layouts are stored between runs, one file per graph hash
+LAYOUT_CACHE_DIR = ".layout_cache"
+
+# Layouts computed or loaded in this process, keyed by graph hash
+_layouts = {}
+
+
+def graph_hash(num_nodes, edges):
+    # Content hash of a graph (node count and edge list, in order)
+    flat = array("q", [num_nodes])
+    for u, v in edges:
+        flat.append(u)
+        flat.append(v)
+    return hashlib.sha1(flat.tobytes()).hexdigest()
+
+
+def graph_layout(num_nodes, edges, cache_dir=LAYOUT_CACHE_DIR):
+    # Spring layout of a graph, computed once per graph: served from memory,
+    # else from <cache_dir>/<hash>.npy, else computed and stored in both.
+    # cache_dir=None keeps the layout in memory only.
+    key = graph_hash(num_nodes, edges)
+    if key in _layouts:
+        return _layouts[key]
+
+    import numpy as np
+
+    path = os.path.join(cache_dir, f"{key}.npy") if cache_dir else None
+    pos = None
+    if path is not None:
+        try:
+            coords = np.load(path)
+            if coords.shape == (num_nodes, 2):
+                pos = dict(enumerate(coords))
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache entry: compute the layout
+
+    if pos is None:
+        import networkx as nx
+
+        G = nx.Graph()
+        G.add_nodes_from(range(num_nodes))
+        G.add_edges_from(edges)
+        pos = nx.spring_layout(G, seed=42)
+        if path is not None:
+            # Written via a temp file, so readers never see a partial layout
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                with open(f"{path}.tmp", "wb") as f:
+                    np.save(f, np.array([pos[node] for node in range(num_nodes)]))
+                os.replace(f"{path}.tmp", path)
+            except OSError:
+                pass  # Read-only location: keep the layout in memory only
+
+    _layouts[key] = pos
+    return pos
+
+
 def save_coloring_image(num_nodes, edges, coloring, output_path, pos=None):
     import matplotlib.pyplot as plt
     import networkx as nx
@@ -7,9 +68,9 @@ def save_coloring_image(num_nodes, edges, coloring, output_path, pos=None):
     G.add_edges_from(edges)
     color_map = [coloring[node] for node in G.nodes]
 
-    # Use layout or generate one if not provided
+    # Use layout or the cached one for this graph if not provided
     if pos is None:
-        pos = nx.spring_layout(G, seed=42)
+        pos = graph_layout(num_nodes, edges)
 
     # Plot and save the graph
     plt.figure(figsize=(10, 8))
@@ -29,27 +90,167 @@ def save_coloring_image(num_nodes, edges, coloring, output_path, pos=None):
 
 
 def save_coloring_frame(num_nodes, edges, coloring, gen_number, folder, pos):
-    import matplotlib.pyplot as plt
-    import networkx as nx
-    import os
+    # One-off frame (e.g. the SA result), drawn like the GA's frames
+    FrameRenderer(num_nodes, edges, pos).save(coloring, gen_number, folder)
 
-    G = nx.Graph()
-    G.add_nodes_from(range(num_nodes))
-    G.add_edges_from(edges)
-    color_map = [coloring[node] for node in G.nodes]
 
-    # Draw the current generation
-    plt.figure(figsize=(10, 8))
-    nx.draw(
-        G,
+class FrameRenderer:
+    # Persistent figure for generation frames. Edges are drawn once into a
+    # cached background; each frame restores it and redraws only the node
+    # markers with new face colors. Uses the object-oriented matplotlib API
+    # (no pyplot state), so it can run on a background thread.
+    def __init__(self, num_nodes, edges, pos, figsize=(10, 8)):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import LineCollection
+        import matplotlib.cm as cm
+        import numpy as np
+
+        xy = np.array([pos[node] for node in range(num_nodes)]).reshape(-1, 2)
+        self.fig = Figure(figsize=figsize)
+        self.canvas = FigureCanvasAgg(self.fig)
+        # The top strip of the figure is left free for the title
+        self.ax = self.fig.add_axes((0, 0, 1, 0.94))
+        self.ax.set_axis_off()
+        segments = xy[np.array(edges, dtype=np.intp).reshape(-1, 2)]
+        self.ax.add_collection(
+            LineCollection(segments, colors="k", linewidths=1.0, zorder=1)
+        )
+        self.ax.update_datalim(xy)
+        self.ax.margins(0.1)
+        self.ax.autoscale_view()
+
+        # Nodes and title are animated: left out of the background and drawn
+        # on top of it for every frame
+        self.nodes = self.ax.scatter(
+            xy[:, 0],
+            xy[:, 1],
+            c=np.zeros(num_nodes),
+            s=100,
+            cmap=cm.tab20,
+            zorder=2,
+            animated=True,
+        )
+        self.title = self.ax.set_title("", animated=True)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def render(self, coloring, gen_number):
+        # Draw a frame and return it as an (height, width, 3) uint8 RGB array
+        import numpy as np
+
+        colors = np.asarray(coloring)
+        self.canvas.restore_region(self.background)
+        self.nodes.set_array(colors)
+        self.nodes.set_clim(colors.min(), colors.max())
+        self.title.set_text(f"Generation {gen_number}")
+        self.ax.draw_artist(self.nodes)
+        self.ax.draw_artist(self.title)
+        return np.asarray(self.canvas.buffer_rgba())[..., :3].copy()
+
+    def save(self, coloring, gen_number, folder):
+        # Render a frame and write it as <folder>/frame_<gen>.png
+        from PIL import Image
+
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"frame_{gen_number:03d}.png")
+        Image.fromarray(self.render(coloring, gen_number)).save(path)
+        return path
+
+
+class FrameRenderQueue:
+    # Renders generation frames on a background thread fed by a bounded queue.
+    # When the renderer falls behind, submit() waits for room, so every frame
+    # is kept; with drop_frames=True it never blocks and skips the frame
+    # instead (counted in self.dropped). Frames are written as PNGs to folder,
+    # or with sink=fn handed over as RGB arrays via fn(rgb, gen_number).
+    def __init__(
+        self,
+        num_nodes,
+        edges,
+        folder,
         pos,
-        node_color=color_map,
-        with_labels=False,
-        node_size=100,
-        cmap=plt.cm.tab20,
-    )
-    plt.title(f"Generation {gen_number}")
-    os.makedirs(folder, exist_ok=True)
-    path = os.path.join(folder, f"frame_{gen_number:03d}.png")
-    plt.savefig(path)
-    plt.close()
+        maxsize=32,
+        background=True,
+        sink=None,
+        drop_frames=False,
+    ):
+        import queue
+        import threading
+
+        self.num_nodes = num_nodes
+        self.edges = edges
+        self.folder = folder
+        self.pos = pos
+        self.sink = sink
+        self.renderer = None
+        self.background = background
+        self.drop_frames = drop_frames
+        self.dropped = 0
+        self.error = None
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.thread = None
+        if background:
+            self.thread = threading.Thread(target=self._worker, daemon=True)
+            self.thread.start()
+
+    def submit(self, coloring, gen_number):
+        import queue
+
+        if not self.background:
+            self._render(list(coloring), gen_number)
+            return
+        if not self.drop_frames:
+            self._put((list(coloring), gen_number))
+            return
+        try:
+            self.queue.put_nowait((list(coloring), gen_number))
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        # Wait for queued frames to be written and stop the worker, then
+        # re-raise the first error the worker hit
+        if self.thread is not None:
+            self._put(None)
+            self.thread.join()
+            self.thread = None
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def _put(self, item):
+        # Blocking put that gives up if the worker is gone. The worker keeps
+        # draining after an error; this only guards against one that died
+        # some other way.
+        import queue
+
+        while self.thread.is_alive():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _render(self, coloring, gen_number):
+        # The renderer is built on first use, i.e. on the rendering thread
+        if self.renderer is None:
+            self.renderer = FrameRenderer(self.num_nodes, self.edges, self.pos)
+        if self.sink is not None:
+            self.sink(self.renderer.render(coloring, gen_number), gen_number)
+        else:
+            self.renderer.save(coloring, gen_number, self.folder)
+
+    def _worker(self):
+        # A failed render (full disk, GIF write error, ...) is kept for close()
+        # and later frames are discarded, so the queue never backs up
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            if self.error is not None:
+                continue
+            try:
+                self._render(*item)
+            except Exception as e:
+                self.error = e